@@ -40,8 +40,7 @@ class Database:
             Product(4, "SNACK002", "Cookies", 3.49, "Chocolate chip cookies", 30),
             Product(5, "DRINK002", "Water", 0.99, "Bottled water", 200),
         ]
-        for product in products:
-            self.products[product.product_id] = product
+        self.products.update((p.product_id, p) for p in products)
         
         # Add sample users
         self.users[1] = Customer(1, "customer@example.com", "password123", 
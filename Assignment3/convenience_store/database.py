@@ -2,30 +2,21 @@
 Database module - simple in-memory data storage (Singleton pattern)
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, ValuesView
 from product import Product
 from user import User, Customer, Admin
 
 class Database:
-    """Singleton class for data storage (in-memory for simplicity)"""
-    
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    """Data storage (in-memory for simplicity), shared via get_db()"""
     
     def __init__(self):
-        if self._initialized:
-            return
-        
-        self._initialized = True
         self.products: Dict[int, Product] = {}
         self.users: Dict[int, User] = {}
+        self._users_by_email: Dict[str, User] = {}  # email -> user index
         self.orders: Dict = {}
+        self._orders_by_customer: Dict[int, List] = {}  # customer_id -> orders index
         self.payments: Dict = {}
+        self._payment_by_order: Dict = {}  # order_id -> payment index
         self.invoices: Dict = {} 
         
         # Initialize with sample data
@@ -42,22 +33,21 @@ class Database:
             Product(5, "DRINK002", "Goddess Water", 0.99, "Bottled water", 200, "/static/images/water.jpg"),
             Product(6, "DRINK003", "Sam Dua", 5.19, "Vietnamese tea", 150, "/static/images/samdua.jpg"),
         ]
-        for product in products:
-            self.products[product.product_id] = product
+        self.products.update((p.product_id, p) for p in products)
         
         # Add sample users
-        self.users[1] = Customer(1, "customer@example.com", "password123", 
-                                "John Doe", "123 Main St")
-        self.users[2] = Admin(2, "admin@example.com", "admin123")
+        self.add_user(Customer(1, "customer@example.com", "password123",
+                            "John Doe", "123 Main St"))
+        self.add_user(Admin(2, "admin@example.com", "admin123"))
     
     # Product operations
     def get_product(self, product_id: int) -> Optional[Product]:
         """Get product by ID"""
         return self.products.get(product_id)
     
-    def get_all_products(self) -> List[Product]:
-        """Get all products"""
-        return list(self.products.values())
+    def get_all_products(self) -> ValuesView[Product]:
+        """Get all products (live view, wrap in list() to snapshot)"""
+        return self.products.values()
     
     def add_product(self, product: Product):
         """Add new product"""
@@ -75,14 +65,16 @@ class Database:
     
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        for user in self.users.values():
-            if user.email == email:
-                return user
-        return None
+        return self._users_by_email.get(email)
     
     def add_user(self, user: User):
         """Add new user"""
+        # Replacing a user: drop the old email so it no longer resolves
+        previous = self.users.get(user.user_id)
+        if previous is not None and self._users_by_email.get(previous.email) is previous:
+            del self._users_by_email[previous.email]
         self.users[user.user_id] = user
+        self._users_by_email[user.email] = user
     
     # Order operations
     def get_order(self, order_id: int):
@@ -91,21 +83,22 @@ class Database:
     
     def get_orders_by_customer(self, customer_id: int) -> List:
         """Get all orders for a customer"""
-        return [order for order in self.orders.values() 
-                if order.customer_id == customer_id]
+        return list(self._orders_by_customer.get(customer_id, ()))
     
-    def get_all_orders(self) -> List:
-        """Get all orders"""
-        return list(self.orders.values())
+    def get_all_orders(self) -> ValuesView:
+        """Get all orders (live view, wrap in list() to snapshot)"""
+        return self.orders.values()
     
     def add_order(self, order):
         """Add new order"""
         self.orders[order.order_id] = order
+        self._orders_by_customer.setdefault(order.customer_id, []).append(order)
     
     # Payment operations
     def add_payment(self, payment):
         """Add new payment"""
         self.payments[payment.payment_id] = payment
+        self._payment_by_order.setdefault(payment.order_id, payment)
     
     def get_payment(self, payment_id: int):
         """Get payment by ID"""
@@ -113,10 +106,7 @@ class Database:
     
     def get_payment_by_order(self, order_id: int):
         """Get payment for a specific order"""
-        for payment in self.payments.values():
-            if payment.order_id == order_id:
-                return payment
-        return None
+        return self._payment_by_order.get(order_id)
     
     # Invoice operations
     def add_invoice(self, invoice):
@@ -127,6 +117,15 @@ class Database:
         """Get invoice for a specific order"""
         return self.invoices.get(order_id)
     
-    def get_all_invoices(self) -> List:
-        """Get all invoices"""
-        return list(self.invoices.values())
+    def get_all_invoices(self) -> ValuesView:
+        """Get all invoices (live view, wrap in list() to snapshot)"""
+        return self.invoices.values()
+
+
+# Single shared instance, created once at import (Singleton)
+_db = Database()
+
+
+def get_db() -> Database:
+    """Return the shared database instance"""
+    return _db
@@ -0,0 +1,31 @@
+"""
+IdCounter module - thread-safe sequential ID generation
+"""
+
+from threading import Lock
+
+
+class IdCounter:
+    """Issues sequential IDs, singly or as reserved contiguous blocks"""
+    
+    __slots__ = ('_next', '_lock')
+    
+    def __init__(self, start: int):
+        self._next = start
+        self._lock = Lock()  # Guards both single and block issuing
+    
+    def next_id(self) -> int:
+        """Return the next ID"""
+        with self._lock:
+            value = self._next
+            self._next += 1
+        return value
+    
+    def reserve(self, n: int) -> range:
+        """Reserve n consecutive IDs and return them as a range"""
+        if n < 0:
+            raise ValueError(f"Cannot reserve a negative number of IDs: {n}")
+        with self._lock:
+            start = self._next
+            self._next += n
+        return range(start, start + n)
@@ -3,15 +3,21 @@ Invoice module - handles invoice generation and tracking
 """
 
 from datetime import datetime
+from id_counter import IdCounter
 
 class Invoice:
     """Represents an invoice for an order"""
     
-    _invoice_counter = 1000  # Start from 1000 for invoice numbers
+    __slots__ = ('invoice_number', 'order_id', 'customer_name', 'items',
+                'total_amount', 'issue_date', 'due_date', '_status',
+                '_issue_date_str', '_due_date_str', '_cached_dict')
     
-    def __init__(self, order_id: int, customer_name: str, items: list, total_amount: float):
-        self.invoice_number = Invoice._invoice_counter
-        Invoice._invoice_counter += 1
+    _invoice_counter = IdCounter(1000)  # Start from 1000 for invoice numbers
+    
+    def __init__(self, order_id: int, customer_name: str, items: list, total_amount: float,
+                invoice_number: int = None):
+        # Use a pre-reserved ID (see reserve_ids) or take the next one
+        self.invoice_number = invoice_number if invoice_number is not None else Invoice._invoice_counter.next_id()
         
         self.order_id = order_id
         self.customer_name = customer_name
@@ -20,6 +26,21 @@ class Invoice:
         self.issue_date = datetime.now()
         self.due_date = datetime.now()  # In real system, this would be calculated
         self.status = "Unpaid"
+        
+        # Dates never change after issue, so format them once
+        self._issue_date_str = self.issue_date.strftime("%Y-%m-%d")
+        self._due_date_str = self.due_date.strftime("%Y-%m-%d")
+        self._cached_dict = None  # Built on first generate_invoice()
+    
+    @property
+    def status(self) -> str:
+        """Payment status of the invoice"""
+        return self._status
+    
+    @status.setter
+    def status(self, value: str):
+        self._status = value
+        self._cached_dict = None  # Status changed, rebuild on next request
     
     def mark_as_paid(self):
         """Mark invoice as paid"""
@@ -27,17 +48,19 @@ class Invoice:
         print(f" Invoice #{self.invoice_number} marked as paid")
     
     def generate_invoice(self) -> dict:
-        """Generate invoice details"""
-        return {
-            "invoice_number": f"INV-{self.invoice_number}",
-            "order_id": self.order_id,
-            "customer_name": self.customer_name,
-            "issue_date": self.issue_date.strftime("%Y-%m-%d"),
-            "due_date": self.due_date.strftime("%Y-%m-%d"),
-            "items": self.items,
-            "total_amount": self.total_amount,
-            "status": self.status
-        }
+        """Generate invoice details (cached until status changes, returns a copy)"""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "invoice_number": f"INV-{self.invoice_number}",
+                "order_id": self.order_id,
+                "customer_name": self.customer_name,
+                "issue_date": self._issue_date_str,
+                "due_date": self._due_date_str,
+                "items": self.items,
+                "total_amount": self.total_amount,
+                "status": self.status
+            }
+        return dict(self._cached_dict)
     
     def view_invoice(self) -> str:
         """View formatted invoice (for admin)"""
@@ -52,8 +75,8 @@ class Invoice:
                     INVOICE
         =====================================
         Invoice No: INV-{self.invoice_number}
-        Issue Date: {self.issue_date.strftime("%Y-%m-%d")}
-        Due Date: {self.due_date.strftime("%Y-%m-%d")}
+        Issue Date: {self._issue_date_str}
+        Due Date: {self._due_date_str}
         
         Order ID: #{self.order_id}
         Customer: {self.customer_name}
@@ -66,5 +89,10 @@ class Invoice:
         =====================================
         """
     
+    @classmethod
+    def reserve_ids(cls, n: int) -> range:
+        """Reserve n consecutive invoice numbers for batch creation"""
+        return cls._invoice_counter.reserve(n)
+    
     def __str__(self):
         return f"Invoice #{self.invoice_number} - Order #{self.order_id} - ${self.total_amount:.2f}"
@@ -18,13 +18,13 @@ from order_item import OrderItem
 from payment import Payment, DigitalWallet, BankDebit, PayPal
 from invoice import Invoice
 from receipt import Receipt
-from database import Database
+from database import get_db
 
 # Create FastAPI app
 app = FastAPI(title="Convenience Store", version="1.0.0")
 
 # Initialize database
-db = Database()
+db = get_db()
 
 # Session storage (simplified - in-memory)
 sessions = {}  # session_id -> user_id
@@ -245,13 +245,13 @@ async def checkout(
     
     # Create order from cart
     # Validate stock before creating order
-    for item in cart.items:
+    for item in cart.items.values():
         if item.product.stock <= 0:
             raise HTTPException(status_code=400, detail=f"{item.product.name} is out of stock")
         if item.quantity > item.product.stock:
             raise HTTPException(status_code=400, detail=f"{item.product.name} has exceeded limited stock (Instock: {item.product.stock})")
 
-    order_items = [OrderItem(item.product, item.quantity) for item in cart.items]
+    order_items = [OrderItem(item.product, item.quantity) for item in cart.items.values()]
     order = Order(user_id, order_items)
     
     # Reduce stock
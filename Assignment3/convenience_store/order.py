@@ -4,15 +4,16 @@ Order module - represents a confirmed customer order
 
 from typing import List
 from datetime import datetime
+from id_counter import IdCounter
+from order_item import round_money
 
 class Order:
     """Represents a confirmed order"""
     
-    _order_counter = 1  # Simple ID generation
+    _order_counter = IdCounter(1)  # Simple ID generation
     
     def __init__(self, customer_id: int, items: List):
-        self.order_id = Order._order_counter
-        Order._order_counter += 1
+        self.order_id = Order._order_counter.next_id()
         
         self.customer_id = customer_id
         self.items = items  # Composition: order owns its items
@@ -22,7 +23,7 @@ class Order:
     
     def _calculate_total(self) -> float:
         """Calculate order total from items"""
-        return sum(item.get_line_total() for item in self.items)
+        return round_money(sum(item.get_line_total() for item in self.items))
     
     def update_status(self, new_status: str):
         """Update order status"""
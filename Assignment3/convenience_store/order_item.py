@@ -2,25 +2,42 @@
 OrderItem module - represents individual items in an order or cart
 """
 
+from dataclasses import dataclass, field, replace
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
 from product import Product
 
 
+def round_money(amount: float) -> float:
+    """Round a dollar total to cents, half-up (shared by cart and order totals)"""
+    # Drop float noise below a millionth first so drift cannot flip a half-cent
+    return float(Decimal(repr(round(amount, 6))).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class OrderItem:
-    """Represents a product with quantity in cart or order"""
+    """Represents a product with quantity in cart or order (immutable)"""
+    
+    product: Product
+    quantity: int
+    unit_price: Optional[float] = None  # Captured from product at time of adding
+    line_total: float = field(init=False)  # Precomputed unit_price * quantity
     
-    def __init__(self, product: Product, quantity: int):
-        self.product = product
-        self.quantity = quantity
-        self.unit_price = product.price  # Capture price at time of adding
+    def __post_init__(self):
+        # Frozen dataclass, so derived fields are set through object.__setattr__
+        if self.unit_price is None:
+            object.__setattr__(self, "unit_price", self.product.price)
+        object.__setattr__(self, "line_total", self.unit_price * self.quantity)
     
     def get_line_total(self) -> float:
-        """Calculate total for this line item"""
-        return self.unit_price * self.quantity
+        """Return total for this line item"""
+        return self.line_total
     
-    def update_quantity(self, quantity: int):
-        """Update quantity of this item"""
+    def with_quantity(self, quantity: int) -> "OrderItem":
+        """Return a copy with a new quantity (keeps captured price)"""
         if quantity > 0:
-            self.quantity = quantity
+            return replace(self, quantity=quantity)
+        return self
     
     def get_details(self) -> dict:
         """Return item details"""
@@ -30,9 +47,9 @@ class OrderItem:
             "sku": self.product.sku,
             "quantity": self.quantity,
             "unit_price": self.unit_price,
-            "line_total": self.get_line_total(),
+            "line_total": self.line_total,
             "image_url": self.product.image_url
         }
     
     def __str__(self):
-        return f"{self.product.name} x{self.quantity} = ${self.get_line_total():.2f}"
+        return f"{self.product.name} x{self.quantity} = ${self.line_total:.2f}"
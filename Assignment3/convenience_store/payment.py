@@ -2,27 +2,28 @@
 Payment module - handles payment processing with Strategy pattern
 """
 
-from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Protocol
+from id_counter import IdCounter
 from receipt import Receipt
 
-class PaymentMethod(ABC):
-    """Abstract base class for payment methods (Strategy Pattern)"""
+class PaymentMethod(Protocol):
+    """Interface for payment methods (Strategy Pattern), matched by duck typing"""
     
-    @abstractmethod
     def process_payment(self, amount: float) -> bool:
         """Process payment and return success status"""
-        pass
+        ...
     
-    @abstractmethod
     def get_method_name(self) -> str:
         """Return payment method name"""
-        pass
+        ...
 
 
-class DigitalWallet(PaymentMethod):
+class DigitalWallet:
     """Digital wallet payment method"""
     
+    __slots__ = ('wallet_provider',)
+    
     def __init__(self, wallet_provider: str):
         self.wallet_provider = wallet_provider
     
@@ -34,9 +35,11 @@ class DigitalWallet(PaymentMethod):
         return f"Digital Wallet ({self.wallet_provider})"
 
 
-class BankDebit(PaymentMethod):
+class BankDebit:
     """Bank debit payment method"""
     
+    __slots__ = ('account_number',)
+    
     def __init__(self, account_number: str):
         self.account_number = account_number[-4:]  # Only store last 4 digits
     
@@ -48,9 +51,11 @@ class BankDebit(PaymentMethod):
         return f"Bank Debit (****{self.account_number})"
 
 
-class PayPal(PaymentMethod):
+class PayPal:
     """PayPal payment method"""
     
+    __slots__ = ('email',)
+    
     def __init__(self, email: str):
         self.email = email
     
@@ -65,16 +70,23 @@ class PayPal(PaymentMethod):
 class Payment:
     """Represents a payment transaction"""
     
-    _payment_counter = 1
+    __slots__ = ('payment_id', 'order_id', 'amount', 'payment_method',
+                'payment_date', 'status', 'receipt', '_payment_date_str',
+                '_method_name')
     
-    def __init__(self, order_id: int, amount: float, payment_method: PaymentMethod):
-        self.payment_id = Payment._payment_counter
-        Payment._payment_counter += 1
+    _payment_counter = IdCounter(1)
+    
+    def __init__(self, order_id: int, amount: float, payment_method: PaymentMethod,
+                payment_id: int = None):
+        # Use a pre-reserved ID (see reserve_ids) or take the next one
+        self.payment_id = payment_id if payment_id is not None else Payment._payment_counter.next_id()
         
         self.order_id = order_id
         self.amount = amount
         self.payment_method = payment_method
+        self._method_name = payment_method.get_method_name()  # Strategy is fixed per payment
         self.payment_date = datetime.now()
+        self._payment_date_str = self.payment_date.strftime("%Y-%m-%d %H:%M:%S")  # Format once
         self.status = "Pending"
         self.receipt = None  # Will be created after successful payment
     
@@ -92,7 +104,7 @@ class Payment:
                 order_id=self.order_id,
                 customer_name=customer_name,
                 amount=self.amount,
-                payment_method=self.payment_method.get_method_name(),
+                payment_method=self._method_name,
                 items=items if items else []
             )
             return self.receipt
@@ -104,9 +116,9 @@ class Payment:
             "payment_id": self.payment_id,
             "order_id": self.order_id,
             "amount": self.amount,
-            "method": self.payment_method.get_method_name(),
+            "method": self._method_name,
             "status": self.status,
-            "payment_date": self.payment_date.strftime("%Y-%m-%d %H:%M:%S")
+            "payment_date": self._payment_date_str
         }
         
         if self.receipt:
@@ -114,5 +126,10 @@ class Payment:
         
         return details
     
+    @classmethod
+    def reserve_ids(cls, n: int) -> range:
+        """Reserve n consecutive payment IDs for batch creation"""
+        return cls._payment_counter.reserve(n)
+    
     def __str__(self):
         return f"Payment #{self.payment_id} - {self.status} - ${self.amount:.2f}"
\ No newline at end of file
@@ -3,16 +3,22 @@ Receipt module - handles receipt generation and printing
 """
 
 from datetime import datetime
+from id_counter import IdCounter
 
 class Receipt:
     """Represents a payment receipt"""
     
-    _receipt_counter = 2000  # Start from 2000 for receipt numbers
+    __slots__ = ('receipt_number', 'payment_id', 'order_id', 'customer_name',
+                'amount', 'items', 'payment_method', 'issue_date', 'printed',
+                '_issue_date_str', '_cached_dict')
+    
+    _receipt_counter = IdCounter(2000)  # Start from 2000 for receipt numbers
     
     def __init__(self, payment_id: int, order_id: int, customer_name: str, 
-                amount: float, payment_method: str, items: list = None):
-        self.receipt_number = Receipt._receipt_counter
-        Receipt._receipt_counter += 1
+                amount: float, payment_method: str, items: list = None,
+                receipt_number: int = None):
+        # Use a pre-reserved ID (see reserve_ids) or take the next one
+        self.receipt_number = receipt_number if receipt_number is not None else Receipt._receipt_counter.next_id()
         
         self.payment_id = payment_id
         self.order_id = order_id
@@ -21,21 +27,25 @@ class Receipt:
         self.items = items if items else []  # List of items purchased
         self.payment_method = payment_method
         self.issue_date = datetime.now()
+        self._issue_date_str = self.issue_date.strftime("%Y-%m-%d %H:%M:%S")  # Format once
         self.printed = False  # Track if receipt was already printed
+        self._cached_dict = None  # Built on first generate_receipt()
     
     def generate_receipt(self) -> dict:
-        """Generate receipt details"""
-        return {
-            "receipt_number": f"RCP-{self.receipt_number}",
-            "payment_id": self.payment_id,
-            "order_id": self.order_id,
-            "customer_name": self.customer_name,
-            "items": self.items,  # Include items list
-            "amount_paid": self.amount,
-            "payment_method": self.payment_method,
-            "payment_date": self.issue_date.strftime("%Y-%m-%d %H:%M:%S"),
-            "status": "Paid"
-        }
+        """Generate receipt details (receipts never change, so cached; returns a copy)"""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "receipt_number": f"RCP-{self.receipt_number}",
+                "payment_id": self.payment_id,
+                "order_id": self.order_id,
+                "customer_name": self.customer_name,
+                "items": self.items,  # Include items list
+                "amount_paid": self.amount,
+                "payment_method": self.payment_method,
+                "payment_date": self._issue_date_str,
+                "status": "Paid"
+            }
+        return dict(self._cached_dict)
     
     def print_receipt(self) -> str:
         """Generate a formatted receipt string (placeholder)"""
@@ -51,7 +61,7 @@ class Receipt:
                 PAYMENT RECEIPT
         =====================================
         Receipt No: RCP-{self.receipt_number}
-        Date: {self.issue_date.strftime("%Y-%m-%d %H:%M:%S")}
+        Date: {self._issue_date_str}
         
         Order ID: #{self.order_id}
         Customer: {self.customer_name}
@@ -65,5 +75,10 @@ class Receipt:
         =====================================
         """
     
+    @classmethod
+    def reserve_ids(cls, n: int) -> range:
+        """Reserve n consecutive receipt numbers for batch creation"""
+        return cls._receipt_counter.reserve(n)
+    
     def __str__(self):
         return f"Receipt #{self.receipt_number} - Payment #{self.payment_id} - ${self.amount:.2f}"
@@ -2,70 +2,114 @@
 ShoppingCart module - manages customer's shopping cart
 """
 
-from typing import List
-from order_item import OrderItem
+from typing import Dict, Iterable, List, Tuple
+from order_item import OrderItem, round_money
+from product import Product
 
 class ShoppingCart:
     """Manages items in customer's shopping cart"""
     
+    __slots__ = ('customer_id', 'items', '_total', '_count')
+    
     def __init__(self, customer_id: int):
         self.customer_id = customer_id
-        self.items: List[OrderItem] = []
+        self.items: Dict[int, OrderItem] = {}  # product_id -> item
+        self._total = 0.0  # Running totals (unrounded), kept in step with items
+        self._count = 0
     
     def add_item(self, product, quantity: int = 1) -> bool:
         """Add product to cart, return True if successful"""
-        if not product.is_available():
-            return False
-        
-        if quantity > product.stock:
+        if not product.is_available() or quantity > product.stock:
             return False
         
         # Check if product already in cart
-        for item in self.items:
-            if item.product.product_id == product.product_id:
-                item.update_quantity(item.quantity + quantity)
-                return True
+        pid = product.product_id
+        existing = self.items.get(pid)
+        if existing:
+            self._set_quantity(pid, existing, existing.quantity + quantity)
+            return True
         
         # Add new item
-        self.items.append(OrderItem(product, quantity))
+        self._insert_item(pid, product, quantity)
+        return True
+    
+    def add_items_bulk(self, pairs: Iterable[Tuple[Product, int]]) -> bool:
+        """Add (product, quantity) pairs all-or-nothing, return True if added"""
+        merged: Dict[int, Tuple[Product, int]] = {}
+        for product, quantity in pairs:
+            if quantity <= 0:
+                return False  # Reject before merging, cart not yet touched
+            _, merged_qty = merged.get(product.product_id, (product, 0))
+            merged[product.product_id] = (product, merged_qty + quantity)
+        
+        # Check every product first (same rule as add_item) so a failure
+        # leaves the cart unchanged
+        for product, quantity in merged.values():
+            if not product.is_available() or quantity > product.stock:
+                return False
+        
+        # One cart write per unique product
+        items = self.items
+        for pid, (product, quantity) in merged.items():
+            existing = items.get(pid)
+            if existing:
+                self._set_quantity(pid, existing, existing.quantity + quantity)
+            else:
+                self._insert_item(pid, product, quantity)
         return True
     
     def remove_item(self, product_id: int) -> bool:
         """Remove item from cart"""
-        for i, item in enumerate(self.items):
-            if item.product.product_id == product_id:
-                self.items.pop(i)
-                return True
-        return False
+        item = self.items.pop(product_id, None)
+        if item is None:
+            return False
+        self._total -= item.line_total
+        self._count -= item.quantity
+        return True
     
     def update_item_quantity(self, product_id: int, quantity: int) -> bool:
         """Update quantity of item in cart"""
         if quantity <= 0:
             return self.remove_item(product_id)
         
-        for item in self.items:
-            if item.product.product_id == product_id:
-                if quantity <= item.product.stock:
-                    item.update_quantity(quantity)
-                    return True
+        item = self.items.get(product_id)
+        if item and quantity <= item.product.stock:
+            self._set_quantity(product_id, item, quantity)
+            return True
         return False
     
     def get_total(self) -> float:
         """Calculate cart total"""
-        return sum(item.get_line_total() for item in self.items)
+        return round_money(self._total)
     
     def get_item_count(self) -> int:
         """Get total number of items in cart"""
-        return sum(item.quantity for item in self.items)
+        return self._count
     
     def clear(self):
         """Empty the cart"""
-        self.items = []
+        self.items = {}
+        self._total = 0.0
+        self._count = 0
+    
+    def _insert_item(self, product_id: int, product: Product, quantity: int):
+        """Add a new item for a product not yet in the cart and adjust running totals"""
+        item = OrderItem(product, quantity)
+        self.items[product_id] = item
+        self._total += item.line_total
+        self._count += item.quantity
+    
+    def _set_quantity(self, product_id: int, item: OrderItem, quantity: int):
+        """Swap in an item with the new quantity and adjust running totals"""
+        new_item = item.with_quantity(quantity)
+        self.items[product_id] = new_item
+        self._total += new_item.line_total - item.line_total
+        self._count += new_item.quantity - item.quantity
     
     def get_items(self) -> List[dict]:
         """Return all items as dictionaries"""
         detailed_items: List[dict] = []
-        for item in self.items:
+        for item in self.items.values():
             entry = item.get_details()
             current_stock = item.product.stock
             entry["current_stock"] = current_stock